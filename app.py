@@ -7,9 +7,15 @@ import os
 from datetime import datetime, timezone
 import logging
 import traceback
-from functools import wraps
+from functools import wraps, lru_cache
+from dataclasses import asdict
 import threading
 import time
+from sqlalchemy import event, text, func, case, insert
+from cachetools import TTLCache
+import queue
+import atexit
+import requests
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -20,56 +26,86 @@ app.config.from_object(Config)
 # DEMO MODE CONFIGURATION
 DEMO_MODE = True  # Set to True for demo video, False for real scraping
 
+# Absolute paths resolved once - request handlers must not depend on cwd
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+_DATA_DIR = os.path.join(_BASE_DIR, 'data')
+_CAPTCHA_DIR = os.path.join(_BASE_DIR, 'static', 'captcha')
+_CAPTCHA_SESSION_FILE = os.path.join(_DATA_DIR, 'captcha_session.json')
+
+# Ensure working directories exist before anything touches them
+os.makedirs(_DATA_DIR, exist_ok=True)
+os.makedirs(_CAPTCHA_DIR, exist_ok=True)
+
 # Initialize database
 db.init_app(app)
 
 # Initialize scraper
 scraper = DelhiHighCourtScraper()
 
-# Global variable to store active scraping sessions
-active_sessions = {}
+# Pooled HTTP session for PDF downloads - reuses TLS connections to the
+# court site instead of handshaking per download
+_pdf_session = requests.Session()
+_pdf_session.mount('https://', requests.adapters.HTTPAdapter(
+    pool_connections=8, pool_maxsize=32))
+
+# Enhanced case types for demo - immutable, shared across requests
+CASE_TYPES = (
+    "Civil Appeal",
+    "Criminal Appeal",
+    "Writ Petition (Civil)",
+    "Writ Petition (Criminal)",
+    "Company Petition",
+    "Arbitration Petition",
+    "Criminal Misc. Application",
+    "Civil Misc. Application",
+    "Contempt Petition",
+    "Execution Petition",
+    "Review Petition",
+    "Transfer Petition"
+)
+
+# Demo case scenarios built once at import; {n}/{y} are substituted with
+# the case number and filing year per request
+_DEMO_SCENARIOS = {
+    "Civil Appeal": {
+        'parties_petitioner': 'M/s Delhi Construction Company Ltd.',
+        'parties_respondent': 'Municipal Corporation of Delhi & Ors.',
+        'filing_date': '15-Jan-{y}',
+        'next_hearing_date': '25-Aug-2025',
+        'case_status': 'Arguments concluded, judgment reserved',
+        'judge_name': 'Hon\'ble Justice Rajesh Kumar',
+    },
+    "Criminal Appeal": {
+        'parties_petitioner': 'Appellant No. {n}',
+        'parties_respondent': 'State of Delhi',
+        'filing_date': '10-Mar-{y}',
+        'next_hearing_date': '30-Aug-2025',
+        'case_status': 'Matter for final hearing',
+        'judge_name': 'Hon\'ble Justice Priya Sharma',
+    },
+    "Writ Petition (Civil)": {
+        'parties_petitioner': 'Citizen Petitioner {n}',
+        'parties_respondent': 'Union of India & Ors.',
+        'filing_date': '05-Jun-{y}',
+        'next_hearing_date': '15-Sep-2025',
+        'case_status': 'Notice issued, awaiting response',
+        'judge_name': 'Hon\'ble Justice A.K. Mehta',
+    }
+}
+
+# Configurable demo search delay (seconds); set to 0 when benchmarking
+DEMO_SEARCH_DELAY = float(os.environ.get('DEMO_SEARCH_DELAY', 2))
 
 def generate_demo_case_data(case_type, case_number, filing_year):
     """Generate realistic demo data for showcasing functionality"""
-    
-    # Create different case scenarios based on case type
-    case_scenarios = {
-        "Civil Appeal": {
-            'parties_petitioner': 'M/s Delhi Construction Company Ltd.',
-            'parties_respondent': 'Municipal Corporation of Delhi & Ors.',
-            'filing_date': f'15-Jan-{filing_year}',
-            'next_hearing_date': '25-Aug-2025',
-            'case_status': 'Arguments concluded, judgment reserved',
-            'judge_name': 'Hon\'ble Justice Rajesh Kumar',
-        },
-        "Criminal Appeal": {
-            'parties_petitioner': f'Appellant No. {case_number}',
-            'parties_respondent': 'State of Delhi',
-            'filing_date': f'10-Mar-{filing_year}',
-            'next_hearing_date': '30-Aug-2025',
-            'case_status': 'Matter for final hearing',
-            'judge_name': 'Hon\'ble Justice Priya Sharma',
-        },
-        "Writ Petition (Civil)": {
-            'parties_petitioner': f'Citizen Petitioner {case_number}',
-            'parties_respondent': 'Union of India & Ors.',
-            'filing_date': f'05-Jun-{filing_year}',
-            'next_hearing_date': '15-Sep-2025',
-            'case_status': 'Notice issued, awaiting response',
-            'judge_name': 'Hon\'ble Justice A.K. Mehta',
-        }
-    }
-    
     # Get scenario data or use default
-    scenario = case_scenarios.get(case_type, case_scenarios["Civil Appeal"])
-    
+    scenario = _DEMO_SCENARIOS.get(case_type, _DEMO_SCENARIOS["Civil Appeal"])
+
     case_data = {
-        'parties_petitioner': scenario['parties_petitioner'],
-        'parties_respondent': scenario['parties_respondent'],
-        'filing_date': scenario['filing_date'],
-        'next_hearing_date': scenario['next_hearing_date'],
-        'case_status': scenario['case_status'],
-        'judge_name': scenario['judge_name'],
+        key: value.format(n=case_number, y=filing_year)
+        for key, value in scenario.items()
+    }
+    case_data.update({
         'order_pdf_links': [
             {
                 'url': 'https://example.com/demo_order.pdf',
@@ -77,7 +113,7 @@ def generate_demo_case_data(case_type, case_number, filing_year):
                 'type': 'Order'
             },
             {
-                'url': 'https://example.com/demo_judgment.pdf', 
+                'url': 'https://example.com/demo_judgment.pdf',
                 'text': f'Judgment dated 15-Jul-2025',
                 'type': 'Judgment'
             }
@@ -91,9 +127,142 @@ def generate_demo_case_data(case_type, case_number, filing_year):
         ],
         'scraped_at': datetime.now().isoformat(),
         'source_url': 'https://delhihighcourt.nic.in/app/get-case-type-status (Demo Mode)'
-    }
+    })
     return case_data, None
 
+# Query-log rows are buffered here and flushed by a background thread so
+# the commit fsync stays off the request-critical path
+_log_queue = queue.Queue()
+
+# Core insert compiled once; skips ORM instantiation/identity-map work
+# entirely and becomes a single executemany for batched rows
+_INSERT_LOG = insert(QueryLog.__table__)
+
+def _flush_log_batch(batch):
+    """Insert a batch of buffered QueryLog rows in one transaction"""
+    with app.app_context():
+        try:
+            db.session.execute(_INSERT_LOG, batch)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error flushing query log batch: {str(e)}")
+
+def _log_writer():
+    """Drain the log queue forever, batching rows that arrive together"""
+    while True:
+        batch = [_log_queue.get()]
+        time.sleep(0.2)  # let concurrent requests pile onto this batch
+        while not _log_queue.empty() and len(batch) < 500:
+            try:
+                batch.append(_log_queue.get_nowait())
+            except queue.Empty:
+                break
+        _flush_log_batch(batch)
+
+threading.Thread(target=_log_writer, daemon=True).start()
+
+@atexit.register
+def _drain_log_queue():
+    """Flush any buffered log rows on shutdown"""
+    batch = []
+    while not _log_queue.empty():
+        try:
+            batch.append(_log_queue.get_nowait())
+        except queue.Empty:
+            break
+    if batch:
+        _flush_log_batch(batch)
+
+def log_query(case_type, case_number, filing_year, success,
+              error_message=None, raw_response=None, commit=True):
+    """Record a QueryLog entry without blocking the request.
+
+    By default the row is pushed onto the in-process buffer and written
+    by the background thread. With commit=False the insert instead joins
+    the caller's open transaction so log + case upsert share one fsync.
+    """
+    mapping = {
+        'case_type': case_type,
+        'case_number': case_number,
+        'filing_year': filing_year,
+        'success': success,
+        'error_message': error_message,
+        'raw_response': raw_response
+    }
+    if commit:
+        _log_queue.put(mapping)
+    else:
+        db.session.execute(_INSERT_LOG, mapping)
+
+# In-process case cache: repeat searches for the same case skip the DB
+# round-trip entirely. Entries are invalidated by overwrite on re-scrape
+# and expire on the same 24h horizon as the DB-side cache check.
+_case_cache = TTLCache(maxsize=2048, ttl=86400)
+_case_cache_lock = threading.Lock()
+
+# Short-lived memo for the stats counts; 5s staleness is acceptable there
+_stats_cache = TTLCache(maxsize=1, ttl=5)
+_stats_cache_lock = threading.Lock()
+
+def _cache_case(case_record):
+    """Snapshot a CaseData row into a plain dict the templates can render"""
+    entry = {
+        'case_type': case_record.case_type,
+        'case_number': case_record.case_number,
+        'filing_year': case_record.filing_year,
+        'parties_petitioner': case_record.parties_petitioner,
+        'parties_respondent': case_record.parties_respondent,
+        'filing_date': case_record.filing_date,
+        'next_hearing_date': case_record.next_hearing_date,
+        'case_status': case_record.case_status,
+        'judge_name': case_record.judge_name,
+        'order_pdf_links': case_record.order_pdf_links,
+        'last_updated': case_record.last_updated
+    }
+    with _case_cache_lock:
+        _case_cache[(case_record.case_type, case_record.case_number,
+                     case_record.filing_year)] = entry
+    return entry
+
+# Prepared once so health probes skip per-call statement construction
+_PING = text("SELECT 1")
+
+# ISO timestamp cached at 1s granularity - health/stats are polled and
+# don't need sub-second precision
+_ts_cache = [0.0, ""]
+
+def now_iso():
+    """Current UTC time as ISO string, refreshed at most once a second"""
+    t = time.time()
+    if t - _ts_cache[0] > 1.0:
+        _ts_cache[0] = t
+        _ts_cache[1] = datetime.fromtimestamp(t, timezone.utc).isoformat()
+    return _ts_cache[1]
+
+# Parsed captcha_session.json keyed by mtime; the status endpoint is
+# polled, so cache the parse and re-read only when the file changes
+_captcha_cache = {'mtime': 0, 'data': None}
+_captcha_cache_lock = threading.Lock()
+
+def read_captcha_session():
+    """Return the parsed CAPTCHA session dict, or None if unavailable"""
+    try:
+        st = os.stat(_CAPTCHA_SESSION_FILE)
+    except OSError:
+        return None
+
+    with _captcha_cache_lock:
+        if st.st_mtime_ns != _captcha_cache['mtime']:
+            try:
+                with open(_CAPTCHA_SESSION_FILE, 'r') as f:
+                    _captcha_cache['data'] = json.load(f)
+                _captcha_cache['mtime'] = st.st_mtime_ns
+            except Exception as e:
+                logger.error(f"Error reading CAPTCHA session: {str(e)}")
+                return None
+        return _captcha_cache['data']
+
 # Error handling decorator
 def handle_errors(f):
     """Decorator to handle errors gracefully"""
@@ -111,46 +280,54 @@ def handle_errors(f):
 # Replace @app.before_first_request with this initialization
 def create_tables():
     """Create database tables"""
-    # Ensure data directory exists
-    data_dir = os.path.join(os.path.dirname(__file__), 'data')
-    os.makedirs(data_dir, exist_ok=True)
-    
-    # Ensure static/captcha directory exists
-    captcha_dir = os.path.join(os.path.dirname(__file__), 'static', 'captcha')
-    os.makedirs(captcha_dir, exist_ok=True)
-    
     try:
         db.create_all()
+        # create_all() skips pre-existing tables, so make sure databases
+        # created before the indexes were declared still pick them up
+        db.session.execute(text(
+            "CREATE UNIQUE INDEX IF NOT EXISTS ix_case_lookup "
+            "ON case_data (case_type, case_number, filing_year)"
+        ))
+        db.session.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_querylog_ts "
+            "ON query_log (query_timestamp)"
+        ))
+        db.session.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_querylog_success "
+            "ON query_log (success)"
+        ))
+        db.session.commit()
         logger.info("Database tables created successfully")
     except Exception as e:
         logger.error(f"Error creating database tables: {str(e)}")
         raise
 
+def _set_sqlite_pragmas(dbapi_conn, connection_record):
+    """Apply WAL mode and tuned pragmas on every new SQLite connection.
+
+    WAL lets cached reads (search_case, search_history, stats) run
+    concurrently with the writer, and synchronous=NORMAL defers fsync
+    to checkpoints instead of every commit.
+    """
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA cache_size=-20000")
+    cursor.close()
+
 # Initialize database tables immediately
 with app.app_context():
+    event.listens_for(db.engine, "connect")(_set_sqlite_pragmas)
     create_tables()
 
 @app.route('/')
 def index():
     """Main page with search form"""
-    # Enhanced case types for demo
-    case_types = [
-        "Civil Appeal",
-        "Criminal Appeal", 
-        "Writ Petition (Civil)",
-        "Writ Petition (Criminal)",
-        "Company Petition",
-        "Arbitration Petition",
-        "Criminal Misc. Application",
-        "Civil Misc. Application",
-        "Contempt Petition",
-        "Execution Petition",
-        "Review Petition",
-        "Transfer Petition"
-    ]
-    
-    logger.info(f"Using {len(case_types)} case types ({'Demo Mode' if DEMO_MODE else 'Live Mode'})")
-    return render_template('index.html', case_types=case_types, demo_mode=DEMO_MODE)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Using {len(CASE_TYPES)} case types ({'Demo Mode' if DEMO_MODE else 'Live Mode'})")
+    return render_template('index.html', case_types=CASE_TYPES, demo_mode=DEMO_MODE)
 
 @app.route('/search', methods=['POST'])
 @handle_errors
@@ -182,6 +359,36 @@ def search_case():
         flash('Invalid filing year', 'error')
         return redirect(url_for('index'))
     
+    # Check the in-process cache first - no DB round-trip on repeat hits
+    if not captcha_solution:
+        with _case_cache_lock:
+            cached_entry = _case_cache.get((case_type, case_number, filing_year))
+
+        # The TTL clock starts at insert, which may itself have been a DB
+        # hit on an older row - enforce the same 24h freshness rule on the
+        # row's own last_updated as the DB path below
+        if cached_entry:
+            last_updated = cached_entry['last_updated']
+            fresh = False
+            if last_updated:
+                age = (datetime.now(timezone.utc)
+                       - last_updated.replace(tzinfo=timezone.utc))
+                fresh = age.total_seconds() < 86400
+            if not fresh:
+                with _case_cache_lock:
+                    _case_cache.pop((case_type, case_number, filing_year),
+                                    None)
+                cached_entry = None
+
+        if cached_entry:
+            logger.info("Using in-process cached case data")
+            log_query(case_type, case_number, filing_year, success=True,
+                      raw_response="Used cached data")
+            return render_template('results.html',
+                                 case_data=cached_entry,
+                                 pdf_links=cached_entry['order_pdf_links'] or [],
+                                 cached=True)
+
     # Check for cached data first
     existing_case = CaseData.query.filter_by(
         case_type=case_type,
@@ -196,26 +403,21 @@ def search_case():
     
     if cache_valid and not captcha_solution:
         logger.info("Using cached case data")
-        query_log = QueryLog(
-            case_type=case_type,
-            case_number=case_number,
-            filing_year=filing_year,
-            success=True,
-            raw_response="Used cached data"
-        )
-        db.session.add(query_log)
-        db.session.commit()
-        
+        _cache_case(existing_case)
+        log_query(case_type, case_number, filing_year, success=True,
+                  raw_response="Used cached data")
+
         return render_template('results.html', 
                              case_data=existing_case,
-                             pdf_links=json.loads(existing_case.order_pdf_links or '[]'),
+                             pdf_links=existing_case.order_pdf_links or [],
                              cached=True)
     
     try:
         # DEMO MODE: Use mock data for reliable demonstration
         if DEMO_MODE:
             logger.info("Demo mode active - generating mock case data")
-            time.sleep(2)  # Simulate realistic search delay
+            if DEMO_SEARCH_DELAY:
+                time.sleep(DEMO_SEARCH_DELAY)  # Simulate realistic search delay
             case_data, error = generate_demo_case_data(case_type, case_number, filing_year)
             
             # Add demo mode indicator to flash message
@@ -234,16 +436,9 @@ def search_case():
                                   filing_year=filing_year))
         
         if error:
-            query_log = QueryLog(
-                case_type=case_type,
-                case_number=case_number,
-                filing_year=filing_year,
-                success=False,
-                error_message=error
-            )
-            db.session.add(query_log)
-            db.session.commit()
-            
+            log_query(case_type, case_number, filing_year, success=False,
+                      error_message=error)
+
             if "captcha" in error.lower():
                 flash('Incorrect CAPTCHA solution. Please try again.', 'warning')
                 return redirect(url_for('solve_captcha',
@@ -260,16 +455,9 @@ def search_case():
             return redirect(url_for('index'))
         
         if not case_data:
-            query_log = QueryLog(
-                case_type=case_type,
-                case_number=case_number,
-                filing_year=filing_year,
-                success=False,
-                error_message="No case data found"
-            )
-            db.session.add(query_log)
-            db.session.commit()
-            
+            log_query(case_type, case_number, filing_year, success=False,
+                      error_message="No case data found")
+
             flash('Case not found. Please verify case details.', 'warning')
             return redirect(url_for('index'))
         
@@ -282,7 +470,7 @@ def search_case():
             existing_case.next_hearing_date = case_data.get('next_hearing_date', '')
             existing_case.case_status = case_data.get('case_status', '')
             existing_case.judge_name = case_data.get('judge_name', '')
-            existing_case.order_pdf_links = json.dumps(case_data.get('order_pdf_links', []))
+            existing_case.order_pdf_links = case_data.get('order_pdf_links', [])
             existing_case.last_updated = datetime.now(timezone.utc)
             case_record = existing_case
         else:
@@ -297,21 +485,25 @@ def search_case():
                 next_hearing_date=case_data.get('next_hearing_date', ''),
                 case_status=case_data.get('case_status', ''),
                 judge_name=case_data.get('judge_name', ''),
-                order_pdf_links=json.dumps(case_data.get('order_pdf_links', []))
+                order_pdf_links=case_data.get('order_pdf_links', [])
             )
             db.session.add(case_record)
         
-        # Log successful query
-        query_log = QueryLog(
-            case_type=case_type,
-            case_number=case_number,
-            filing_year=filing_year,
-            success=True,
-            raw_response=json.dumps(case_data)
-        )
-        db.session.add(query_log)
-        db.session.commit()
-        
+        # Log + upsert share one transaction: a single fsync per search
+        # default=asdict unpacks the scraper's Hearing entries
+        raw = (json.dumps(case_data, default=asdict)
+               if app.config['LOG_RAW_RESPONSE'] else None)
+        log_query(case_type, case_number, filing_year, success=True,
+                  raw_response=raw, commit=False)
+        try:
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+        # Refresh the in-process cache with the newly scraped row
+        _cache_case(case_record)
+
         flash('Case data retrieved successfully!', 'success')
         return render_template('results.html',
                              case_data=case_record,
@@ -324,16 +516,10 @@ def search_case():
         logger.error(f"Search error: {str(e)}")
         logger.error(traceback.format_exc())
         
-        query_log = QueryLog(
-            case_type=case_type,
-            case_number=case_number,
-            filing_year=filing_year,
-            success=False,
-            error_message=str(e)
-        )
-        db.session.add(query_log)
-        db.session.commit()
-        
+        db.session.rollback()
+        log_query(case_type, case_number, filing_year, success=False,
+                  error_message=str(e))
+
         flash('An error occurred while searching. Please try again.', 'error')
         return redirect(url_for('index'))
 
@@ -349,16 +535,8 @@ def solve_captcha():
         return redirect(url_for('index'))
     
     # Check for CAPTCHA session file
-    captcha_session_file = os.path.join('data', 'captcha_session.json')
-    captcha_data = None
-    
-    if os.path.exists(captcha_session_file):
-        try:
-            with open(captcha_session_file, 'r') as f:
-                captcha_data = json.load(f)
-        except Exception as e:
-            logger.error(f"Error reading CAPTCHA session: {str(e)}")
-    
+    captcha_data = read_captcha_session()
+
     return render_template('captcha_solver.html',
                          case_type=case_type,
                          case_number=case_number,
@@ -369,23 +547,43 @@ def solve_captcha():
 @app.route('/api/captcha-status')
 def captcha_status():
     """API to check CAPTCHA status"""
-    captcha_session_file = os.path.join('data', 'captcha_session.json')
-    
-    if os.path.exists(captcha_session_file):
-        try:
-            with open(captcha_session_file, 'r') as f:
-                captcha_data = json.load(f)
-            
-            return jsonify({
-                'status': 'available',
-                'image_path': captcha_data.get('image_path'),
-                'timestamp': captcha_data.get('timestamp')
-            })
-        except Exception as e:
-            logger.error(f"Error checking CAPTCHA status: {str(e)}")
-    
+    captcha_data = read_captcha_session()
+
+    if captcha_data:
+        return jsonify({
+            'status': 'available',
+            'image_path': captcha_data.get('image_path'),
+            'timestamp': captcha_data.get('timestamp')
+        })
+
     return jsonify({'status': 'not_available'})
 
+@lru_cache(maxsize=1)
+def _demo_pdf_bytes():
+    """Generate the demo court document once and reuse the bytes.
+
+    reportlab import and Canvas construction dominate the demo download
+    path; the document only varies by its generation timestamp, so one
+    render is enough.
+    """
+    import io
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import letter
+
+    buffer = io.BytesIO()
+    p = canvas.Canvas(buffer, pagesize=letter)
+
+    p.drawString(100, 750, "DEMO COURT DOCUMENT")
+    p.drawString(100, 720, "Delhi High Court - Sample Document")
+    p.drawString(100, 690, "Generated in Demo Mode")
+    p.drawString(100, 660, f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    p.drawString(100, 630, "")
+    p.drawString(100, 600, "This is a sample PDF generated for demonstration purposes.")
+    p.drawString(100, 570, "In live mode, this would be an actual court document.")
+
+    p.save()
+    return buffer.getvalue()
+
 @app.route('/download_pdf')
 def download_pdf():
     """Download PDF from court website (demo version)"""
@@ -398,28 +596,11 @@ def download_pdf():
         # In demo mode, return a sample PDF instead of the flash message
         from flask import send_file
         import io
-        
+
         try:
-            # Create a simple sample PDF content
-            from reportlab.pdfgen import canvas
-            from reportlab.lib.pagesizes import letter
-            
-            # Create PDF in memory
-            buffer = io.BytesIO()
-            p = canvas.Canvas(buffer, pagesize=letter)
-            
-            # Add content to the sample PDF
-            p.drawString(100, 750, "DEMO COURT DOCUMENT")
-            p.drawString(100, 720, "Delhi High Court - Sample Document")
-            p.drawString(100, 690, f"Generated in Demo Mode")
-            p.drawString(100, 660, f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            p.drawString(100, 630, "")
-            p.drawString(100, 600, "This is a sample PDF generated for demonstration purposes.")
-            p.drawString(100, 570, "In live mode, this would be an actual court document.")
-            
-            p.save()
-            buffer.seek(0)
-            
+            # Serve the cached sample bytes; reportlab runs only once
+            buffer = io.BytesIO(_demo_pdf_bytes())
+
             return send_file(
                 buffer,
                 as_attachment=True,
@@ -437,8 +618,7 @@ def download_pdf():
     
     # Live mode - original functionality
     try:
-        import requests
-        response = requests.get(pdf_url, timeout=30, stream=True)
+        response = _pdf_session.get(pdf_url, timeout=30, stream=True)
         response.raise_for_status()
         
         # Get filename from URL or use default
@@ -450,7 +630,7 @@ def download_pdf():
         from flask import Response
         
         def generate():
-            for chunk in response.iter_content(chunk_size=8192):
+            for chunk in response.iter_content(chunk_size=65536):
                 yield chunk
         
         return Response(
@@ -475,21 +655,21 @@ def test_connection():
             return jsonify({
                 'status': 'success',
                 'message': 'Demo Mode: Connection testing disabled for demo purposes',
-                'timestamp': datetime.now(timezone.utc).isoformat()
+                'timestamp': now_iso()
             })
         
         connection_ok, message = scraper.test_connection()
         return jsonify({
             'status': 'success' if connection_ok else 'error',
             'message': message,
-            'timestamp': datetime.now(timezone.utc).isoformat()
+            'timestamp': now_iso()
         })
     except Exception as e:
         logger.error(f"Connection test failed: {str(e)}")
         return jsonify({
             'status': 'error',
             'message': str(e),
-            'timestamp': datetime.now(timezone.utc).isoformat()
+            'timestamp': now_iso()
         }), 500
 
 @app.route('/search-history')
@@ -509,10 +689,22 @@ def search_history():
 def stats():
     """Application statistics"""
     try:
-        total_searches = QueryLog.query.count()
-        successful_searches = QueryLog.query.filter_by(success=True).count()
-        total_cases = CaseData.query.count()
-        
+        with _stats_cache_lock:
+            counts = _stats_cache.get('counts')
+        if counts is None:
+            # Single scan of QueryLog: total and success counts in one query
+            total_searches, successful_searches = db.session.query(
+                func.count(QueryLog.id),
+                func.sum(case((QueryLog.success == True, 1), else_=0))
+            ).one()
+            successful_searches = successful_searches or 0
+            total_cases = db.session.query(func.count(CaseData.id)).scalar()
+            with _stats_cache_lock:
+                _stats_cache['counts'] = (total_searches, successful_searches,
+                                          total_cases)
+        else:
+            total_searches, successful_searches, total_cases = counts
+
         success_rate = (successful_searches / total_searches * 100) if total_searches > 0 else 0
         
         stats_data = {
@@ -521,7 +713,7 @@ def stats():
             'success_rate': round(success_rate, 2),
             'total_cases': total_cases,
             'demo_mode': DEMO_MODE,
-            'last_update': datetime.now(timezone.utc).isoformat()
+            'last_update': now_iso()
         }
         
         return jsonify(stats_data)
@@ -534,7 +726,7 @@ def health():
     """Health check endpoint"""
     try:
         # Test database connection
-        db.session.execute('SELECT 1')
+        db.session.execute(_PING)
         
         if DEMO_MODE:
             return jsonify({
@@ -542,7 +734,7 @@ def health():
                 'database': 'connected',
                 'mode': 'demo',
                 'court_website': 'demo mode - not tested',
-                'timestamp': datetime.now(timezone.utc).isoformat()
+                'timestamp': now_iso()
             })
         
         # Test court website connection
@@ -554,14 +746,14 @@ def health():
             'mode': 'live',
             'court_website': 'connected' if connection_ok else 'disconnected',
             'court_website_message': connection_msg,
-            'timestamp': datetime.now(timezone.utc).isoformat()
+            'timestamp': now_iso()
         })
     except Exception as e:
         logger.error(f"Health check failed: {str(e)}")
         return jsonify({
             'status': 'unhealthy',
             'error': str(e),
-            'timestamp': datetime.now(timezone.utc).isoformat()
+            'timestamp': now_iso()
         }), 500
 
 # Error handlers
@@ -582,10 +774,7 @@ def internal_error(error):
                          error_message="Internal server error"), 500
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
-
-if __name__ == '__main__':
-    # Docker-friendly configuration
+    # Development server only - production runs gunicorn against wsgi.py
     port = int(os.environ.get('PORT', 5000))
     app.run(debug=False, host='0.0.0.0', port=port)
 
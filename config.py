@@ -1,5 +1,6 @@
 import os
 from dotenv import load_dotenv
+from sqlalchemy.pool import QueuePool
 
 load_dotenv()
 
@@ -7,6 +8,17 @@ class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///data/database.db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'connect_args': {'check_same_thread': False},
+        'poolclass': QueuePool,
+        'pool_size': 10,
+        'max_overflow': 5,
+        'pool_recycle': 1800,
+        'pool_pre_ping': True
+    }
     COURT_BASE_URL = os.environ.get('COURT_BASE_URL') or 'https://delhihighcourt.nic.in'
     REQUEST_TIMEOUT = 30
     MAX_RETRIES = 3
+    # Store the full scraped payload in QueryLog.raw_response (audit/debug
+    # only - doubles JSON serialization and write bytes per search)
+    LOG_RAW_RESPONSE = os.environ.get('LOG_RAW_RESPONSE', 'false').lower() == 'true'
@@ -12,7 +12,12 @@ class QueryLog(db.Model):
     success = db.Column(db.Boolean, default=False)
     error_message = db.Column(db.Text)
     raw_response = db.Column(db.Text)
-    
+
+    __table_args__ = (
+        db.Index('ix_querylog_ts', 'query_timestamp'),
+        db.Index('ix_querylog_success', 'success'),
+    )
+
     def __repr__(self):
         return f'<QueryLog {self.case_type}/{self.case_number}/{self.filing_year}>'
 
@@ -27,8 +32,13 @@ class CaseData(db.Model):
     next_hearing_date = db.Column(db.String(50))
     case_status = db.Column(db.String(100))
     judge_name = db.Column(db.String(200))
-    order_pdf_links = db.Column(db.Text)  # JSON string of links
+    order_pdf_links = db.Column(db.JSON)  # list of link dicts
     last_updated = db.Column(db.DateTime, default=datetime.utcnow)
-    
+
+    __table_args__ = (
+        db.Index('ix_case_lookup', 'case_type', 'case_number', 'filing_year',
+                 unique=True),
+    )
+
     def __repr__(self):
         return f'<CaseData {self.case_type}/{self.case_number}/{self.filing_year}>'
@@ -1,6 +1,8 @@
-import requests
+import httpx
 from bs4 import BeautifulSoup
-import json
+from selectolax.lexbor import LexborHTMLParser
+import orjson
+import hashlib
 import time
 import re
 from selenium import webdriver
@@ -13,26 +15,110 @@ from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.keys import Keys
 import logging
-from urllib.parse import urljoin, urlparse
+from dataclasses import dataclass
+from urllib.parse import urljoin, urlparse, urlsplit
 from datetime import datetime
 import base64
 import os
-from PIL import Image
-import io
 import socket
+import shutil
+import queue
+import atexit
+import asyncio
+import ahocorasick
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Add timeout to prevent WebDriverManager from hanging
 socket.setdefaulttimeout(30)
 
+# Paths anchored to this file, not the cwd - gunicorn may start from
+# anywhere and the Flask side reads these same absolute locations
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+_DATA_DIR = os.path.join(_BASE_DIR, 'data')
+_CAPTCHA_DIR = os.path.join(_BASE_DIR, 'static', 'captcha')
+_CAPTCHA_SESSION_FILE = os.path.join(_DATA_DIR, 'captcha_session.json')
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# chromedriver path resolved once per process and shared by every
+# scraper instance - ChromeDriverManager().install() consults the network
+# and hashes binaries, far too expensive for a per-request path
+_CHROMEDRIVER_PATH = None
+
+def _resolve_chromedriver_path():
+    global _CHROMEDRIVER_PATH
+    if _CHROMEDRIVER_PATH is None:
+        try:
+            _CHROMEDRIVER_PATH = ChromeDriverManager().install()
+        except Exception as e:
+            logger.warning(f"ChromeDriverManager failed ({str(e)}), falling back to PATH")
+            _CHROMEDRIVER_PATH = shutil.which('chromedriver')
+            if not _CHROMEDRIVER_PATH:
+                raise
+    return _CHROMEDRIVER_PATH
+
+@dataclass(slots=True)
+class Hearing:
+    """One case-history entry; slots keep the per-entry footprint small"""
+    date: str
+    proceedings: str
+
+
 class DelhiHighCourtScraper:
+    # Response-page indicators grouped by what they mean; matched in a
+    # single Aho-Corasick pass instead of one substring scan per keyword
+    _PAGE_INDICATORS = {
+        'captcha_error': [
+            "invalid captcha", "wrong captcha", "incorrect captcha",
+            "captcha mismatch"
+        ],
+        'captcha_required': [
+            "captcha", "enter captcha", "security code"
+        ],
+        'no_data': [
+            "no records found", "no data found", "case not found",
+            "invalid case"
+        ],
+        'maintenance': [
+            "maintenance", "under maintenance", "temporarily unavailable",
+            "service unavailable", "server error", "503", "502", "500",
+            "access denied", "forbidden", "not found"
+        ]
+    }
+
+    # Selector fallback chains used per search; built once at class scope
+    # rather than as fresh lists on every call
+    _CAPTCHA_IMAGE_XPATHS = (
+        "//img[contains(@src,'captcha')]",
+        "//img[contains(@alt,'captcha')]",
+        "//img[contains(@id,'captcha')]",
+        "//img[contains(@class,'captcha')]",
+        "//canvas[contains(@id,'captcha')]"
+    )
+    _CAPTCHA_INPUT_XPATHS = (
+        "//input[contains(@name,'captcha')]",
+        "//input[contains(@id,'captcha')]",
+        "//input[contains(@placeholder,'captcha')]",
+        "//input[contains(@class,'captcha')]"
+    )
+    _SUBMIT_XPATHS = (
+        "//input[@type='submit']",
+        "//button[@type='submit']",
+        "//input[@value='Search']",
+        "//button[contains(text(),'Search')]"
+    )
+
     def __init__(self):
         # Updated URLs based on the current Delhi High Court website
         self.base_url = "https://www.delhihighcourt.nic.in"
         self.search_url = "https://delhihighcourt.nic.in/app/get-case-type-status"
         
+        # Scheme+host parsed once; root-relative hrefs become absolute by
+        # concatenation instead of a urljoin parse per link
+        base = urlsplit(self.base_url)
+        self._base_root = f"{base.scheme}://{base.netloc}"
+
         # Alternative URLs to try if primary fails
         self.alternative_urls = [
             "https://dhccaseinfo.nic.in/pcase/guiCaseWise.php",
@@ -40,21 +126,109 @@ class DelhiHighCourtScraper:
             "https://www.delhihighcourt.nic.in/web/"
         ]
         
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        })
+        # Pooled HTTP/2-capable client: keep-alive connections avoid a TLS
+        # handshake per probe/fast-path request, and connect-level retries
+        # absorb transient resets without a failed probe
+        self.session = httpx.Client(
+            transport=httpx.HTTPTransport(
+                http2=True,
+                retries=2,
+                limits=httpx.Limits(max_connections=32,
+                                    max_keepalive_connections=16)),
+            timeout=httpx.Timeout(10.0, connect=5.0),
+            follow_redirects=True,
+            headers={
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.5',
+                'Accept-Encoding': 'gzip, deflate',
+                'Upgrade-Insecure-Requests': '1'
+            })
         self.max_retries = 3
         self.retry_delay = 2
-        
+
+        # One automaton over all page indicators; built once per scraper
+        self._ac = ahocorasick.Automaton()
+        for category, keywords in self._PAGE_INDICATORS.items():
+            for keyword in keywords:
+                self._ac.add_word(keyword, (category, keyword))
+        self._ac.make_automaton()
+
+        # Case-type option text per URL - the dropdown contents are static,
+        # so scan them once and answer later lookups from the map
+        self._option_cache = {}
+
+        # get_case_types drives a full browser yet returns an effectively
+        # static list; serve repeats from here for an hour
+        self._case_types_cache = None
+        self._case_types_ts = 0.0
+        self._case_types_ttl = 3600
+
+        # On-disk cache of parsed results keyed by response digest: court
+        # pages only change when new hearings happen, so an unchanged body
+        # skips the whole extraction pass (and survives worker restarts)
+        self._parse_cache_dir = os.path.join(_DATA_DIR, 'parse_cache')
+        os.makedirs(self._parse_cache_dir, exist_ok=True)
+        self._parse_cache_ttl = 6 * 3600
+
+        # Pool of warm Chrome instances - browser cold-start dominates a
+        # 1-3 page workflow, so drivers are reused across requests
+        self._driver_pool = queue.Queue()
+        self._pool_size = 2
+        atexit.register(self.shutdown)
+
+    def acquire_driver(self):
+        """Get a driver from the pool, creating one if none are idle"""
+        try:
+            return self._driver_pool.get_nowait()
+        except queue.Empty:
+            return self.setup_driver()
+
+    # Page-load timeout every pooled driver is configured with; restored
+    # on release because some workflows raise it for their own run
+    _PAGE_LOAD_TIMEOUT = 8
+
+    def release_driver(self, driver):
+        """Reset a driver and return it to the pool for reuse"""
+        if driver is None:
+            return
+        try:
+            driver.set_page_load_timeout(self._PAGE_LOAD_TIMEOUT)
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+        except Exception:
+            # Driver is wedged - throw it away rather than pool it
+            try:
+                driver.quit()
+            except Exception:
+                pass
+            return
+        if self._driver_pool.qsize() < self._pool_size:
+            self._driver_pool.put(driver)
+        else:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+    def shutdown(self):
+        """Quit all pooled drivers (registered at exit)"""
+        while True:
+            try:
+                driver = self._driver_pool.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
     def setup_driver(self):
         """Setup Chrome driver with optimal options and aggressive timeouts"""
         chrome_options = Options()
+        # Return from driver.get() at DOMContentLoaded instead of onload -
+        # the explicit WebDriverWaits already gate on form readiness
+        chrome_options.page_load_strategy = 'eager'
         chrome_options.add_argument('--headless')
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
@@ -69,122 +243,262 @@ class DelhiHighCourtScraper:
         chrome_options.add_argument('--ignore-certificate-errors-invalid-spki')
         chrome_options.add_argument('--disable-extensions')
         chrome_options.add_argument('--disable-plugins')
-        chrome_options.add_argument('--disable-images')
         chrome_options.add_argument('--timeout=30')
         
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         
         try:
-            service = Service(ChromeDriverManager().install())
+            service = Service(_resolve_chromedriver_path())
             driver = webdriver.Chrome(service=service, options=chrome_options)
             driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+
+            # Block static subresources over CDP - trackers, fonts and
+            # styling aren't needed to drive the form. No image patterns:
+            # setBlockedURLs has no allowlist, and CAPTCHA images must
+            # stay loadable for _save_captcha_image.
+            try:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": [
+                    "*.woff*", "*.css", "*.svg",
+                    "*google-analytics*", "*gtag*", "*doubleclick*"
+                ]})
+            except Exception as e:
+                logger.warning(f"Could not set CDP resource blocking: {str(e)}")
             
-            # Set aggressive timeouts to prevent hanging
-            driver.set_page_load_timeout(20)  # 20 seconds max for page load
-            driver.implicitly_wait(10)        # 10 seconds max for element finding
+            # Set aggressive timeouts to prevent hanging. No implicit wait:
+            # it would stack onto every find_element fallback probe, and
+            # element readiness is gated by explicit waits instead.
+            # abort fast on stuck resources
+            driver.set_page_load_timeout(self._PAGE_LOAD_TIMEOUT)
             
             return driver
         except Exception as e:
             logger.error(f"Failed to setup Chrome driver: {str(e)}")
             raise Exception(f"Chrome driver setup failed: {str(e)}")
         
+    @staticmethod
+    def _match_option_value(select, wanted):
+        """Submittable value of the option whose text matches `wanted`.
+
+        Mirrors the exact-then-partial matching used when driving the
+        real dropdown; returns None when no option text matches.
+        """
+        wanted_lower = wanted.lower()
+        partial = None
+        for option in select.find_all('option'):
+            text = option.get_text(strip=True)
+            if not text:
+                continue
+            text_lower = text.lower()
+            value = option.get('value')
+            submitted = value if value is not None else text
+            if text_lower == wanted_lower:
+                return submitted
+            if partial is None and (wanted_lower in text_lower
+                                    or text_lower in wanted_lower):
+                partial = submitted
+        return partial
+
+    def _try_http_fastpath(self, case_type, case_number, filing_year, url):
+        """Attempt the search with a plain HTTP POST, no browser involved.
+
+        For URLs that serve a static form without CAPTCHA, this is orders
+        of magnitude cheaper than driving Chrome. Returns parsed case
+        data, or None when the page needs a real browser (CAPTCHA,
+        JS-rendered form, network failure).
+        """
+        try:
+            response = self.session.get(url, timeout=15)
+            if response.status_code != 200:
+                return None
+
+            soup = BeautifulSoup(response.text, 'lxml')
+
+            # CAPTCHA means we need the Selenium workflow
+            if soup.select_one("img[src*=captcha]"):
+                logger.info("Fast path skipped: CAPTCHA present")
+                return None
+
+            form = soup.find('form')
+            if not form:
+                return None
+
+            # Carry over hidden tokens (CSRF etc.) and fill the case fields
+            form_data = {}
+            for hidden in form.find_all('input', type='hidden'):
+                if hidden.get('name'):
+                    form_data[hidden['name']] = hidden.get('value', '')
+
+            field_found = False
+            for select in form.find_all('select'):
+                name = (select.get('name') or '').lower()
+                if 'case' in name and 'type' in name:
+                    # A select submits the option's value attribute, not
+                    # its label - resolve the wanted label to that value
+                    submitted = self._match_option_value(select, case_type)
+                    if submitted is None:
+                        logger.info("Fast path skipped: case type not in form options")
+                        return None
+                    form_data[select['name']] = submitted
+                    field_found = True
+                elif 'year' in name:
+                    submitted = self._match_option_value(select,
+                                                         str(filing_year))
+                    form_data[select['name']] = (submitted
+                                                 if submitted is not None
+                                                 else str(filing_year))
+            for inp in form.find_all('input'):
+                name = (inp.get('name') or '').lower()
+                if 'case' in name and ('no' in name or 'number' in name):
+                    form_data[inp['name']] = str(case_number)
+                elif 'year' in name:
+                    form_data[inp['name']] = str(filing_year)
+
+            if not field_found or not form_data:
+                return None
+
+            action = urljoin(url, form.get('action') or url)
+            post_response = self.session.post(action, data=form_data, timeout=15)
+            if post_response.status_code != 200:
+                return None
+
+            return self._parse_case_details(post_response.text, action)
+
+        except Exception as e:
+            logger.info(f"HTTP fast path failed for {url}: {str(e)}")
+            return None
+
     def fetch_case_data(self, case_type, case_number, filing_year):
         """
         Fetch case data from Delhi High Court with retry logic and multiple URL attempts
         """
         urls_to_try = [self.search_url] + self.alternative_urls
-        
-        for url in urls_to_try:
-            logger.info(f"Trying URL: {url}")
-            
-            for attempt in range(self.max_retries):
-                driver = None
+
+        # Fire all candidate URLs at once and take the first definitive
+        # answer; wall time becomes max(per-URL) instead of sum(per-URL).
+        # No `with` block: its shutdown(wait=True) would hold the winning
+        # result hostage until the slowest dead host timed out. Stragglers
+        # are abandoned - each worker releases its driver in its own
+        # finally block.
+        executor = ThreadPoolExecutor(max_workers=len(urls_to_try))
+        try:
+            futures = {
+                executor.submit(self._try_one_url, url, case_type,
+                                case_number, filing_year): url
+                for url in urls_to_try
+            }
+
+            captcha_result = None
+            for future in as_completed(futures):
                 try:
-                    logger.info(f"Attempt {attempt + 1}: Searching for case: {case_type}/{case_number}/{filing_year}")
-                    
-                    driver = self.setup_driver()
-                    
-                    # Navigate to case status page
-                    logger.info(f"Navigating to {url}...")
-                    driver.get(url)
-                    
-                    # Wait for page to load completely
-                    WebDriverWait(driver, 20).until(
-                        EC.any_of(
-                            EC.presence_of_element_located((By.TAG_NAME, "form")),
-                            EC.presence_of_element_located((By.NAME, "case_type")),
-                            EC.presence_of_element_located((By.ID, "case_type")),
-                            EC.presence_of_element_located((By.CLASS_NAME, "form-control"))
-                        )
-                    )
-                    
-                    # Check for maintenance or error messages
-                    if self._check_site_status(driver):
-                        logger.warning("Site under maintenance, trying next URL...")
-                        break  # Try next URL
-                    
-                    # Fill the search form
-                    success = self._fill_search_form(driver, case_type, case_number, filing_year)
-                    if not success:
-                        logger.warning("Failed to fill search form, trying next URL...")
-                        break  # Try next URL
-                    
-                    # Handle CAPTCHA if present
-                    captcha_result = self._handle_captcha(driver)
-                    if captcha_result == "manual_required":
-                        return "captcha_required", "Please solve the CAPTCHA and resubmit"
-                    elif not captcha_result:
-                        return None, "CAPTCHA handling failed"
-                    
-                    # Submit form and wait for results
-                    case_data = self._submit_and_parse_results_with_timeout(driver)
-                    if case_data == "timeout":
-                        return None, "Search timed out - court website is responding slowly"
-                    elif case_data:
-                        logger.info("Case data retrieved successfully")
-                        return case_data, None
-                    else:
-                        logger.info("No case data found with this URL, trying alternatives...")
-                        break  # Try next URL
-                        
-                except TimeoutException:
-                    logger.warning(f"Timeout on attempt {attempt + 1} with URL {url}")
-                    if attempt == self.max_retries - 1:
-                        logger.warning(f"Max retries reached for {url}, trying next URL...")
-                        break  # Try next URL
-                except WebDriverException as e:
-                    logger.warning(f"WebDriver error on attempt {attempt + 1}: {str(e)}")
-                    if attempt == self.max_retries - 1:
-                        break  # Try next URL
+                    case_data, error = future.result()
                 except Exception as e:
-                    logger.error(f"Unexpected error on attempt {attempt + 1}: {str(e)}")
-                    if attempt == self.max_retries - 1:
-                        break  # Try next URL
-                finally:
-                    if driver:
-                        try:
-                            driver.quit()
-                        except:
-                            pass
-                
-                # Wait before retry
-                if attempt < self.max_retries - 1:
-                    logger.info(f"Waiting {self.retry_delay} seconds before retry...")
-                    time.sleep(self.retry_delay)
-        
-        return None, "All URLs and retries exhausted - unable to fetch case data"
+                    logger.error(f"Error trying {futures[future]}: {str(e)}")
+                    continue
+
+                if case_data == "captcha_required":
+                    # Remember it, but keep waiting in case another URL
+                    # answers without a CAPTCHA
+                    captcha_result = (case_data, error)
+                elif case_data:
+                    logger.info("Case data retrieved successfully")
+                    return case_data, error
+
+            if captcha_result:
+                return captcha_result
+
+            return None, "All URLs and retries exhausted - unable to fetch case data"
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _try_one_url(self, url, case_type, case_number, filing_year):
+        """Run the full search workflow against a single URL with retries"""
+        logger.info(f"Trying URL: {url}")
+
+        # Try a browserless POST first; fall back to Selenium only
+        # when the page actually needs it
+        case_data = self._try_http_fastpath(case_type, case_number,
+                                            filing_year, url)
+        if case_data:
+            logger.info("Case data retrieved via HTTP fast path")
+            return case_data, None
+
+        for attempt in range(self.max_retries):
+            driver = None
+            try:
+                logger.info(f"Attempt {attempt + 1}: Searching for case: {case_type}/{case_number}/{filing_year}")
+
+                driver = self.acquire_driver()
+
+                # Navigate to case status page
+                logger.info(f"Navigating to {url}...")
+                driver.get(url)
+
+                # Wait for page to load completely
+                WebDriverWait(driver, 20).until(
+                    EC.any_of(
+                        EC.presence_of_element_located((By.TAG_NAME, "form")),
+                        EC.presence_of_element_located((By.NAME, "case_type")),
+                        EC.presence_of_element_located((By.ID, "case_type")),
+                        EC.presence_of_element_located((By.CLASS_NAME, "form-control"))
+                    )
+                )
+
+                # Check for maintenance or error messages
+                if self._check_site_status(driver):
+                    logger.warning("Site under maintenance, giving up on this URL...")
+                    return None, "Site under maintenance"
+
+                # Fill the search form
+                success = self._fill_search_form(driver, case_type, case_number, filing_year)
+                if not success:
+                    logger.warning("Failed to fill search form, giving up on this URL...")
+                    return None, "Failed to fill search form"
+
+                # Handle CAPTCHA if present
+                captcha_result = self._handle_captcha(driver)
+                if captcha_result == "manual_required":
+                    return "captcha_required", "Please solve the CAPTCHA and resubmit"
+                elif not captcha_result:
+                    return None, "CAPTCHA handling failed"
+
+                # Submit form and wait for results
+                case_data = self._submit_and_parse_results_with_timeout(driver)
+                if case_data == "timeout":
+                    return None, "Search timed out - court website is responding slowly"
+                elif case_data:
+                    return case_data, None
+                else:
+                    logger.info("No case data found with this URL...")
+                    return None, "No case data found"
+
+            except TimeoutException:
+                logger.warning(f"Timeout on attempt {attempt + 1} with URL {url}")
+            except WebDriverException as e:
+                logger.warning(f"WebDriver error on attempt {attempt + 1}: {str(e)}")
+            except Exception as e:
+                logger.error(f"Unexpected error on attempt {attempt + 1}: {str(e)}")
+            finally:
+                self.release_driver(driver)
+                driver = None
+
+            # Wait before retry
+            if attempt < self.max_retries - 1:
+                logger.info(f"Waiting {self.retry_delay} seconds before retry...")
+                time.sleep(self.retry_delay)
+
+        return None, "Max retries reached"
 
     def fetch_case_data_with_captcha(self, case_type, case_number, filing_year, captcha_solution=None):
         """Modified fetch method that handles CAPTCHA workflow with aggressive timeouts"""
         driver = None
         try:
-            driver = self.setup_driver()
+            driver = self.acquire_driver()
             logger.info(f"Fetching case data for {case_type}/{case_number}/{filing_year}")
             
-            # Set very aggressive timeouts
+            # Set very aggressive timeouts (explicit waits cover elements)
             driver.set_page_load_timeout(15)  # 15 seconds max for any page load
-            driver.implicitly_wait(5)         # 5 seconds max for element finding
             
             # Navigate to search page with timeout
             try:
@@ -242,95 +556,108 @@ class DelhiHighCourtScraper:
             logger.error(f"Error in fetch_case_data_with_captcha: {str(e)}")
             return None, str(e)
         finally:
-            if driver:
-                try:
-                    driver.quit()
-                except:
-                    pass
+            self.release_driver(driver)
     
+    def _scan_page_indicators(self, text):
+        """One linear pass over the page; returns the categories present"""
+        found = set()
+        for _, (category, _keyword) in self._ac.iter(text):
+            found.add(category)
+        return found
+
     def _check_site_status(self, driver):
         """Check if the website is showing maintenance or error messages"""
         try:
-            # Check for common maintenance indicators
-            maintenance_indicators = [
-                "maintenance", "under maintenance", "temporarily unavailable",
-                "service unavailable", "server error", "503", "502", "500",
-                "access denied", "forbidden", "not found"
-            ]
-            
-            page_text = driver.page_source.lower()
+            # Title first: real maintenance/error pages put the marker
+            # there, and driver.title is a tiny payload compared to the
+            # multi-MB DOM serialization page_source triggers
             page_title = driver.title.lower()
-            
-            for indicator in maintenance_indicators:
-                if indicator in page_text or indicator in page_title:
-                    logger.warning(f"Site issue detected: {indicator}")
+            if 'maintenance' in self._scan_page_indicators(page_title):
+                logger.warning("Site issue detected in page title")
+                return True
+
+            # Cheap in-browser body-length probe: an error page is small,
+            # so only tiny documents warrant the full page_source scan
+            body_length = driver.execute_script(
+                "return document.body ? document.body.innerText.length : 0;")
+            if body_length < 4096:
+                page_text = driver.page_source.lower()
+                if 'maintenance' in self._scan_page_indicators(page_text):
+                    logger.warning("Site issue detected")
                     return True
             return False
         except:
             return False
     
+    # Combined CSS selectors - one querySelector round-trip replaces a
+    # chain of WebDriverWait probes per field
+    _CASE_TYPE_QS = (
+        "select[name=case_type], select[id=case_type], select.case-type, "
+        "select[name*=case][name*=type], select[id*=case][id*=type]"
+    )
+    _CASE_NUMBER_QS = (
+        "input[name=case_no], input[name=case_number], "
+        "input[id=case_no], input[id=case_number], "
+        "input[name*=case][name*=no], input[name*=case][name*=number]"
+    )
+    _YEAR_QS = (
+        "input[name=case_year], input[name=filing_year], input[name=year], "
+        "select[id=case_year], select[id=filing_year], "
+        "input[name*=year], select[name*=year]"
+    )
+
+    def _query_selector(self, driver, css):
+        """Find the first element matching a CSS selector list via JS"""
+        return driver.execute_script(
+            "return document.querySelector(arguments[0]);", css)
+
+    def _get_option_map(self, driver, select_element):
+        """Lowercased option-text map for a select, cached per URL"""
+        url = driver.current_url
+        option_map = self._option_cache.get(url)
+        if option_map is None:
+            texts = driver.execute_script(
+                "return Array.from(arguments[0].options).map(o => o.text);",
+                select_element)
+            option_map = {t.strip().lower(): t for t in texts}
+            self._option_cache[url] = option_map
+        return option_map
+
     def _fill_search_form(self, driver, case_type, case_number, filing_year):
         """Fill the search form with case details - supports multiple form layouts"""
         try:
-            # Try multiple selectors for case type dropdown
-            case_type_selectors = [
-                (By.NAME, "case_type"),
-                (By.ID, "case_type"),
-                (By.CLASS_NAME, "case-type"),
-                (By.XPATH, "//select[contains(@name,'case') and contains(@name,'type')]"),
-                (By.XPATH, "//select[contains(@id,'case') and contains(@id,'type')]")
-            ]
-            
-            case_type_element = None
-            for selector in case_type_selectors:
-                try:
-                    case_type_element = WebDriverWait(driver, 10).until(
-                        EC.presence_of_element_located(selector)
-                    )
-                    break
-                except:
-                    continue
-            
-            if not case_type_element:
+            # The first lookup doubles as the page-ready guard: with eager
+            # page loads the select can appear shortly after
+            # DOMContentLoaded, so poll it instead of probing once
+            try:
+                case_type_element = WebDriverWait(driver, 10).until(
+                    lambda d: self._query_selector(d, self._CASE_TYPE_QS))
+            except TimeoutException:
                 logger.error("Could not find case type dropdown")
                 return False
-            
+
             # Select case type
             case_type_select = Select(case_type_element)
-            
-            # Try to select by visible text first, then by partial match
-            try:
-                case_type_select.select_by_visible_text(case_type)
-                logger.info(f"Selected case type: {case_type}")
-            except:
-                # Try partial matching for case type
-                for option in case_type_select.options:
-                    if case_type.lower() in option.text.lower() or option.text.lower() in case_type.lower():
-                        case_type_select.select_by_visible_text(option.text)
-                        logger.info(f"Selected case type by partial match: {option.text}")
+            option_map = self._get_option_map(driver, case_type_element)
+            wanted = case_type.lower()
+
+            matched = option_map.get(wanted)
+            if not matched:
+                # Partial match against the cached option texts
+                for text_lower, text in option_map.items():
+                    if wanted in text_lower or text_lower in wanted:
+                        matched = text
                         break
-                else:
-                    logger.warning(f"Could not find case type: {case_type}")
-                    return False
-            
-            # Try multiple selectors for case number input
-            case_number_selectors = [
-                (By.NAME, "case_no"),
-                (By.NAME, "case_number"),
-                (By.ID, "case_no"),
-                (By.ID, "case_number"),
-                (By.XPATH, "//input[contains(@name,'case') and contains(@name,'no')]"),
-                (By.XPATH, "//input[contains(@name,'case') and contains(@name,'number')]")
-            ]
-            
-            case_number_input = None
-            for selector in case_number_selectors:
-                try:
-                    case_number_input = driver.find_element(*selector)
-                    break
-                except:
-                    continue
-            
+
+            if matched:
+                case_type_select.select_by_visible_text(matched)
+                logger.info(f"Selected case type: {matched}")
+            else:
+                logger.warning(f"Could not find case type: {case_type}")
+                return False
+
+            # Case number input
+            case_number_input = self._query_selector(driver, self._CASE_NUMBER_QS)
             if case_number_input:
                 case_number_input.clear()
                 case_number_input.send_keys(str(case_number))
@@ -338,26 +665,9 @@ class DelhiHighCourtScraper:
             else:
                 logger.error("Could not find case number input field")
                 return False
-            
-            # Try multiple selectors for filing year
-            year_selectors = [
-                (By.NAME, "case_year"),
-                (By.NAME, "filing_year"),
-                (By.NAME, "year"),
-                (By.ID, "case_year"),
-                (By.ID, "filing_year"),
-                (By.XPATH, "//input[contains(@name,'year')]"),
-                (By.XPATH, "//select[contains(@name,'year')]")
-            ]
-            
-            year_input = None
-            for selector in year_selectors:
-                try:
-                    year_input = driver.find_element(*selector)
-                    break
-                except:
-                    continue
-            
+
+            # Filing year field (input or dropdown)
+            year_input = self._query_selector(driver, self._YEAR_QS)
             if year_input:
                 if year_input.tag_name == 'select':
                     # If it's a dropdown
@@ -390,17 +700,8 @@ class DelhiHighCourtScraper:
             captcha_input = None
             captcha_found = False
             
-            # Multiple CAPTCHA detection methods
-            captcha_image_selectors = [
-                "//img[contains(@src,'captcha')]",
-                "//img[contains(@alt,'captcha')]", 
-                "//img[contains(@id,'captcha')]",
-                "//img[contains(@class,'captcha')]",
-                "//canvas[contains(@id,'captcha')]"
-            ]
-            
             # Find CAPTCHA image
-            for selector in captcha_image_selectors:
+            for selector in self._CAPTCHA_IMAGE_XPATHS:
                 try:
                     captcha_image = driver.find_element(By.XPATH, selector)
                     captcha_found = True
@@ -410,16 +711,11 @@ class DelhiHighCourtScraper:
                     continue
             
             # Find CAPTCHA input field
-            captcha_input_selectors = [
-                "//input[contains(@name,'captcha')]",
-                "//input[contains(@id,'captcha')]", 
-                "//input[contains(@placeholder,'captcha')]",
-                "//input[contains(@class,'captcha')]"
-            ]
-            
-            for selector in captcha_input_selectors:
+            captcha_input_xpath = None
+            for selector in self._CAPTCHA_INPUT_XPATHS:
                 try:
                     captcha_input = driver.find_element(By.XPATH, selector)
+                    captcha_input_xpath = selector
                     logger.info(f"CAPTCHA input found with selector: {selector}")
                     break
                 except NoSuchElementException:
@@ -433,19 +729,20 @@ class DelhiHighCourtScraper:
                 captcha_filename = self._save_captcha_image(captcha_image, driver)
                 
                 if captcha_filename:
-                    # Store CAPTCHA details in session for web interface
+                    # Store CAPTCHA details in session for web interface;
+                    # store the XPath rather than the (unserializable)
+                    # WebElement so the element can be re-resolved later
                     captcha_data = {
                         'image_path': captcha_filename,
-                        'input_element': captcha_input,
+                        'input_xpath': captcha_input_xpath,
                         'timestamp': datetime.now().isoformat(),
                         'status': 'waiting_for_user'
                     }
-                    
+
                     # Save to temporary file for Flask to access
-                    captcha_session_file = os.path.join('data', 'captcha_session.json')
-                    with open(captcha_session_file, 'w') as f:
-                        json.dump(captcha_data, f)
-                    
+                    with open(_CAPTCHA_SESSION_FILE, 'wb') as f:
+                        f.write(orjson.dumps(captcha_data))
+
                     logger.info("CAPTCHA session saved - waiting for user input")
                     return "manual_required"
                 else:
@@ -463,7 +760,7 @@ class DelhiHighCourtScraper:
         """Save CAPTCHA image for user to solve manually"""
         try:
             # Create captcha directory if it doesn't exist
-            captcha_dir = os.path.join('static', 'captcha')
+            captcha_dir = _CAPTCHA_DIR
             os.makedirs(captcha_dir, exist_ok=True)
             
             # Generate unique filename
@@ -471,13 +768,36 @@ class DelhiHighCourtScraper:
             captcha_filename = f"captcha_{timestamp}.png"
             captcha_path = os.path.join(captcha_dir, captcha_filename)
             
-            # Take screenshot of CAPTCHA element
-            captcha_screenshot = captcha_element.screenshot_as_png
-            
+            # Fetch the image bytes directly instead of going through the
+            # CDP screenshot pipeline
+            image_bytes = None
+            src = captcha_element.get_attribute('src') or ''
+
+            if src.startswith('data:image'):
+                # Inline data URI - decode it, zero network round-trips
+                image_bytes = base64.b64decode(src.split(',', 1)[1])
+            elif src:
+                # Re-fetch over HTTP with the driver's session cookies
+                try:
+                    for cookie in driver.get_cookies():
+                        self.session.cookies.set(
+                            cookie['name'], cookie['value'],
+                            domain=cookie.get('domain') or '')
+                    response = self.session.get(
+                        urljoin(driver.current_url, src), timeout=15)
+                    response.raise_for_status()
+                    image_bytes = response.content
+                except Exception as e:
+                    logger.warning(f"HTTP CAPTCHA fetch failed, falling back to screenshot: {str(e)}")
+
+            if image_bytes is None:
+                # Canvas CAPTCHAs or missing src - screenshot still works
+                image_bytes = captcha_element.screenshot_as_png
+
             # Save the image
             with open(captcha_path, 'wb') as f:
-                f.write(captcha_screenshot)
-            
+                f.write(image_bytes)
+
             logger.info(f"CAPTCHA image saved: {captcha_path}")
             return captcha_filename
             
@@ -491,14 +811,8 @@ class DelhiHighCourtScraper:
             # If CAPTCHA solution provided, fill it in
             if captcha_solution:
                 logger.info("Filling CAPTCHA solution...")
-                captcha_input_selectors = [
-                    "//input[contains(@name,'captcha')]",
-                    "//input[contains(@id,'captcha')]",
-                    "//input[contains(@placeholder,'captcha')]"
-                ]
-                
                 captcha_input = None
-                for selector in captcha_input_selectors:
+                for selector in self._CAPTCHA_INPUT_XPATHS:
                     try:
                         captcha_input = WebDriverWait(driver, 5).until(
                             EC.presence_of_element_located((By.XPATH, selector))
@@ -516,15 +830,8 @@ class DelhiHighCourtScraper:
                     return None
             
             # Find submit button with timeout
-            submit_selectors = [
-                "//input[@type='submit']",
-                "//button[@type='submit']", 
-                "//input[@value='Search']",
-                "//button[contains(text(),'Search')]"
-            ]
-            
             submit_button = None
-            for selector in submit_selectors:
+            for selector in self._SUBMIT_XPATHS:
                 try:
                     submit_button = WebDriverWait(driver, 5).until(
                         EC.element_to_be_clickable((By.XPATH, selector))
@@ -537,59 +844,52 @@ class DelhiHighCourtScraper:
                 logger.error("Submit button not found")
                 return None
             
+            original_url = driver.current_url
+
             # Click submit with timeout protection
             logger.info("Clicking submit button...")
             submit_button.click()
-            
+
             # Wait for response with STRICT timeout
             logger.info(f"Waiting for response (max {timeout} seconds)...")
-            
+
+            # One in-browser predicate per poll instead of six separate
+            # DOM queries with full-body text serialization each round
+            response_ready_js = """
+                if (document.location.href !== arguments[0]) return true;
+                if (document.querySelector('table')) return true;
+                var text = document.body ? document.body.innerText : '';
+                return /No records found|Invalid|captcha/i.test(text);
+            """
+
             try:
-                # Wait for ANY change in the page
-                WebDriverWait(driver, timeout).until(
-                    EC.any_of(
-                        # Page content changes
-                        EC.presence_of_element_located((By.TAG_NAME, "table")),
-                        # Error messages appear
-                        EC.text_to_be_present_in_element((By.TAG_NAME, "body"), "No records found"),
-                        EC.text_to_be_present_in_element((By.TAG_NAME, "body"), "Invalid"),
-                        # CAPTCHA appears
-                        EC.text_to_be_present_in_element((By.TAG_NAME, "body"), "captcha"),
-                        EC.text_to_be_present_in_element((By.TAG_NAME, "body"), "CAPTCHA"),
-                        # URL changes
-                        EC.url_changes(driver.current_url)
-                    )
+                WebDriverWait(driver, timeout, poll_frequency=0.25).until(
+                    lambda d: d.execute_script(response_ready_js, original_url)
                 )
             except TimeoutException:
                 logger.warning(f"TIMEOUT: No response after {timeout} seconds")
                 return "timeout"
             
-            # Quick checks for different response types
-            page_source = driver.page_source.lower()
-            
-            # Check for CAPTCHA errors
-            captcha_errors = ["invalid captcha", "wrong captcha", "incorrect captcha", "captcha mismatch"]
-            if any(error in page_source for error in captcha_errors):
+            # Classify the response with a single scan of the page
+            categories = self._scan_page_indicators(driver.page_source.lower())
+
+            if 'captcha_error' in categories:
                 logger.warning("CAPTCHA error detected")
                 return "captcha_error"
-            
-            # Check for new CAPTCHA requirement
-            if any(indicator in page_source for indicator in ["captcha", "enter captcha", "security code"]):
+
+            if 'captcha_required' in categories:
                 logger.info("New CAPTCHA detected after submission")
                 # Save new CAPTCHA and return requirement
                 self._handle_captcha(driver)
                 return "captcha_required"
-            
-            # Check for no results
-            no_data_indicators = ["no records found", "no data found", "case not found", "invalid case"]
-            if any(indicator in page_source for indicator in no_data_indicators):
+
+            if 'no_data' in categories:
                 logger.info("No case data found")
                 return None
             
             # Try to parse results
             logger.info("Parsing case details...")
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            case_data = self._parse_case_details(soup, driver.current_url)
+            case_data = self._parse_case_details(driver.page_source, driver.current_url)
             
             if case_data:
                 logger.info("Case data parsed successfully")
@@ -606,8 +906,71 @@ class DelhiHighCourtScraper:
         """Legacy method - redirect to timeout version"""
         return self._submit_and_parse_results_with_timeout(driver, captcha_solution)
     
-    def _parse_case_details(self, soup, current_url):
+    # Field classification as one compiled regex - a single C-level scan
+    # per label replaces ~30 Python substring checks. Group names map
+    # straight onto case_data keys via match.lastgroup.
+    _FIELD_RE = re.compile(
+        r"(?P<parties_petitioner>petitioner|appellant|applicant|plaintiff)"
+        r"|(?P<parties_respondent>respondent|defendant|opposite party)"
+        r"|(?P<filing_date>filing date|date of filing|filed on|date filed"
+        r"|registration date|date of registration)"
+        r"|(?P<next_hearing_date>next date|next hearing|next listing)"
+        r"|(?P<case_status>\bstatus\b)"
+        r"|(?P<judge_name>judge|bench|coram|before|hon'?ble|justice)",
+        re.IGNORECASE
+    )
+
+    def _map_field(self, case_data, label, value):
+        """Assign a label/value pair to the matching case_data field.
+
+        Returns the field name that was filled, or None.
+        """
+        match = self._FIELD_RE.search(label)
+        if match:
+            if value and value != '-' and value.lower() != 'not available':
+                case_data[match.lastgroup] = value
+                return match.lastgroup
+        return None
+
+    def _load_parsed(self, digest):
+        """Return the cached parse for a response digest, or None"""
+        path = os.path.join(self._parse_cache_dir, digest + '.json')
+        try:
+            if time.time() - os.path.getmtime(path) > self._parse_cache_ttl:
+                os.remove(path)
+                return None
+            with open(path, 'rb') as f:
+                case_data = orjson.loads(f.read())
+            # Re-hydrate history entries so cache hits hand consumers the
+            # same Hearing shape as a fresh parse
+            case_data['case_history'] = [
+                Hearing(**entry)
+                for entry in case_data.get('case_history', [])
+            ]
+            return case_data
+        except (OSError, TypeError, orjson.JSONDecodeError):
+            return None
+
+    def _store_parsed(self, digest, case_data):
+        """Persist a successful parse keyed by its response digest"""
+        path = os.path.join(self._parse_cache_dir, digest + '.json')
+        try:
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(case_data))
+        except (OSError, TypeError) as e:
+            logger.warning(f"Could not cache parsed case: {str(e)}")
+
+    def _parse_case_details(self, html, current_url):
         """Parse case details from the HTML response with enhanced parsing"""
+        # Identical response bodies parse identically - answer repeat
+        # lookups from the on-disk cache without any tree walk
+        digest = hashlib.blake2b(html.encode('utf-8', 'ignore'),
+                                 digest_size=16).hexdigest()
+        cached = self._load_parsed(digest)
+        if cached is not None:
+            logger.info("Case details served from parse cache")
+            return cached
+
         case_data = {
             'parties_petitioner': '',
             'parties_respondent': '',
@@ -620,77 +983,70 @@ class DelhiHighCourtScraper:
             'scraped_at': datetime.now().isoformat(),
             'source_url': current_url
         }
-        
+
         try:
-            # Enhanced field mapping with more variations
-            field_mappings = {
-                'parties_petitioner': [
-                    'petitioner', 'appellant', 'applicant', 'plaintiff',
-                    'petitioner(s)', 'appellant(s)', 'applicant(s)'
-                ],
-                'parties_respondent': [
-                    'respondent', 'defendant', 'opposite party',
-                    'respondent(s)', 'defendant(s)'
-                ],
-                'filing_date': [
-                    'filing date', 'date of filing', 'filed on', 'date filed',
-                    'registration date', 'date of registration'
-                ],
-                'next_hearing_date': [
-                    'next date', 'next hearing', 'next listing', 'next date of hearing',
-                    'next hearing date', 'date of next hearing'
-                ],
-                'case_status': [
-                    'status', 'case status', 'current status', 'present status'
-                ],
-                'judge_name': [
-                    'judge', 'bench', 'coram', 'before', 'hon\'ble',
-                    'justice', 'chief justice'
-                ]
+            # One C-backed parse; this tree is the canonical view of the
+            # response and every extraction below reads from it
+            tree = LexborHTMLParser(html)
+
+            # Error pages announce themselves in the title - bail before
+            # paying for the table/container walks below
+            title_node = tree.css_first('title')
+            if title_node is not None:
+                title = title_node.text(strip=True).lower()
+                categories = self._scan_page_indicators(title)
+                if 'no_data' in categories or 'invalid' in title:
+                    logger.warning(f"Error page detected from title: {title}")
+                    return None
+
+            # Stop walking rows as soon as every target field has a value -
+            # large order-history tables would otherwise dominate parse time
+            targets_remaining = {
+                'parties_petitioner', 'parties_respondent', 'filing_date',
+                'next_hearing_date', 'case_status', 'judge_name'
             }
-            
-            # Find all tables and divs on the page
-            containers = soup.find_all(['table', 'div', 'span'])
-            
-            for container in containers:
-                # Look for case information in table rows
-                if container.name == 'table':
-                    rows = container.find_all('tr')
-                    
-                    for row in rows:
-                        cells = row.find_all(['td', 'th'])
-                        if len(cells) >= 2:
-                            label = cells[0].get_text(strip=True).lower()
-                            value = cells[1].get_text(strip=True)
-                            
-                            # Map fields using enhanced mappings
-                            for field, keywords in field_mappings.items():
-                                if any(keyword in label for keyword in keywords):
-                                    if value and value != '-' and value.lower() != 'not available':
-                                        case_data[field] = value
-                                    break
-                
-                # Look for case information in divs with specific classes or patterns
-                elif container.name in ['div', 'span']:
-                    text_content = container.get_text(strip=True)
+
+            for row in tree.css('table tr'):
+                if not targets_remaining:
+                    break
+                # Direct child walk; a css('td, th') call per row would
+                # re-run selector machinery for every single row
+                cells = [cell for cell in row.iter()
+                         if cell.tag in ('td', 'th')]
+                if len(cells) >= 2:
+                    label = cells[0].text(strip=True).lower()
+                    value = cells[1].text(strip=True)
+                    filled = self._map_field(case_data, label, value)
+                    if filled:
+                        targets_remaining.discard(filled)
+
+            # Fall back to "Label: value" divs/spans only when the tables
+            # didn't yield the key fields
+            if not any(case_data[f] for f in ('parties_petitioner',
+                                              'parties_respondent',
+                                              'filing_date', 'case_status')):
+                for container in tree.css('div, span'):
+                    if not targets_remaining:
+                        break
+                    # Only leaf containers: stringifying every ancestor of
+                    # a nested div tree re-walks the same text repeatedly
+                    if any(child.tag in ('div', 'span')
+                           for child in container.iter()):
+                        continue
+                    text_content = container.text(strip=True)
                     if ':' in text_content:
-                        parts = text_content.split(':', 1)
-                        if len(parts) == 2:
-                            label = parts[0].strip().lower()
-                            value = parts[1].strip()
-                            
-                            # Map fields using enhanced mappings
-                            for field, keywords in field_mappings.items():
-                                if any(keyword in label for keyword in keywords):
-                                    if value and value != '-' and value.lower() != 'not available':
-                                        case_data[field] = value
-                                    break
-            
+                        label, _, value = text_content.partition(':')
+                        filled = self._map_field(case_data,
+                                                 label.strip().lower(),
+                                                 value.strip())
+                        if filled:
+                            targets_remaining.discard(filled)
+
             # Extract PDF links
-            case_data['order_pdf_links'] = self._extract_pdf_links(soup)
-            
+            case_data['order_pdf_links'] = self._extract_pdf_links(tree)
+
             # Extract case history/chronology if available
-            case_data['case_history'] = self._extract_case_history(soup)
+            case_data['case_history'] = self._extract_case_history(tree)
             
             # Clean up empty fields
             for key, value in case_data.items():
@@ -705,6 +1061,7 @@ class DelhiHighCourtScraper:
             
             if data_found:
                 logger.info("Case details parsed successfully")
+                self._store_parsed(digest, case_data)
                 return case_data
             else:
                 logger.warning("No meaningful case data found")
@@ -714,144 +1071,229 @@ class DelhiHighCourtScraper:
             logger.error(f"Error parsing case details: {str(e)}")
             return case_data
     
-    def _extract_pdf_links(self, soup):
+    # Single compiled scan instead of 7 substring checks (each with its
+    # own .lower() allocation) per link - pages can carry hundreds
+    _PDF_LINK_RE = re.compile(
+        r'pdf|order|judgment|judgement|notice|document|download',
+        re.IGNORECASE
+    )
+
+    # Document classification as one alternation whose group names are
+    # the labels themselves; a single scan replaces the pattern-per-label
+    # loop and match.lastgroup is the answer
+    _DOC_TYPE_RE = re.compile(
+        r"(?P<Order>order)"
+        r"|(?P<Judgment>judge?ment)"
+        r"|(?P<Notice>notice)"
+        r"|(?P<Petition>petition)"
+        r"|(?P<Application>application)",
+        re.IGNORECASE
+    )
+
+    def _extract_pdf_links(self, tree):
         """Extract PDF document links with enhanced detection"""
-        pdf_links = []
-        
+        # Columnar accumulation: grow three flat lists during the scan
+        # instead of allocating a dict per candidate link
+        urls, texts = [], []
+
         try:
             # Look for PDF links with multiple patterns
-            links = soup.find_all('a', href=True)
-            
-            for link in links:
-                href = link['href']
-                link_text = link.get_text(strip=True)
-                
+            for link in tree.css('a[href]'):
+                href = link.attributes.get('href') or ''
+                link_text = link.text(strip=True)
+
                 # Enhanced PDF detection
-                is_pdf = (
-                    href.lower().endswith('.pdf') or
-                    'pdf' in href.lower() or
-                    'order' in link_text.lower() or
-                    'judgment' in link_text.lower() or
-                    'judgement' in link_text.lower() or
-                    'notice' in link_text.lower() or
-                    'document' in link_text.lower() or
-                    'download' in link_text.lower()
-                )
-                
+                is_pdf = bool(self._PDF_LINK_RE.search(href) or
+                              self._PDF_LINK_RE.search(link_text))
+
                 if is_pdf and href != '#':
-                    # Convert relative URLs to absolute
+                    # Convert relative URLs to absolute; root-relative
+                    # hrefs (the overwhelmingly common case) are a cheap
+                    # concatenation
                     if href.startswith('http'):
-                        full_url = href
+                        urls.append(href)
+                    elif href.startswith('/'):
+                        urls.append(self._base_root + href)
                     else:
-                        full_url = urljoin(self.base_url, href)
-                    
-                    pdf_links.append({
-                        'url': full_url,
-                        'text': link_text or 'Court Document',
-                        'type': self._classify_document(link_text)
-                    })
-        
+                        urls.append(urljoin(self.base_url, href))
+                    texts.append(link_text)
+
         except Exception as e:
             logger.error(f"Error extracting PDF links: {str(e)}")
-        
-        return pdf_links
+
+        # Materialized as dicts only at the end - the result feeds a JSON
+        # database column, which a namedtuple would silently flatten to a
+        # key-less array
+        return [{'url': url,
+                 'text': text or 'Court Document',
+                 'type': self._classify_document(text)}
+                for url, text in zip(urls, texts)]
     
     def _classify_document(self, text):
         """Classify document type based on link text"""
-        text_lower = text.lower()
-        
-        if 'order' in text_lower:
-            return 'Order'
-        elif 'judgment' in text_lower or 'judgement' in text_lower:
-            return 'Judgment'
-        elif 'notice' in text_lower:
-            return 'Notice'
-        elif 'petition' in text_lower:
-            return 'Petition'
-        elif 'application' in text_lower:
-            return 'Application'
-        else:
-            return 'Document'
+        match = self._DOC_TYPE_RE.search(text)
+        return match.lastgroup if match else 'Document'
     
-    def _extract_case_history(self, soup):
+    # Header keywords that mark a table as hearing history; matched with
+    # one case-insensitive scan instead of nine substring checks
+    _HISTORY_RE = re.compile(
+        r'date|hearing|proceeding|order|listing|cause list|history'
+        r'|chronology',
+        re.IGNORECASE
+    )
+
+    @staticmethod
+    def _capped_text(node, limit):
+        """Concatenate a node's text, stopping once `limit` chars are kept.
+
+        node.text() would stringify the whole subtree first; walking the
+        text nodes with a running total never allocates more than we
+        return plus one chunk.
+        """
+        parts = []
+        total = 0
+        for child in node.traverse(include_text=True):
+            if not child.is_text_node:
+                continue
+            piece = child.text_content.strip()
+            if not piece:
+                continue
+            parts.append(piece)
+            total += len(piece)
+            if total >= limit:
+                break
+        text = ''.join(parts)
+        return text[:limit] if len(text) > limit else text
+
+    def _extract_case_history(self, tree):
         """Extract case hearing history if available"""
         history = []
-        
+
         try:
             # Look for hearing history tables with enhanced detection
-            tables = soup.find_all('table')
-            
-            for table in tables:
-                # Check if this table contains hearing dates
-                header_row = table.find('tr')
-                if header_row:
-                    header_text = header_row.get_text().lower()
-                    
-                    # Enhanced history table detection
-                    history_indicators = [
-                        'date', 'hearing', 'proceeding', 'order', 'next date',
-                        'listing', 'cause list', 'history', 'chronology'
-                    ]
-                    
-                    if any(keyword in header_text for keyword in history_indicators):
-                        rows = table.find_all('tr')[1:]  # Skip header
-                        
-                        for row in rows:
-                            cells = row.find_all(['td', 'th'])
-                            if len(cells) >= 2:
-                                date = cells[0].get_text(strip=True)
-                                proceedings = cells[1].get_text(strip=True)
-                                
-                                if date and proceedings and date != '-' and proceedings != '-':
-                                    history.append({
-                                        'date': date,
-                                        'proceedings': proceedings[:500]  # Limit length
-                                    })
-        
+            for table in tree.css('table'):
+                rows = table.css('tr')
+                if not rows:
+                    continue
+
+                # One compiled scan over the header decides whether the
+                # table is worth walking at all; unrelated tables are
+                # skipped before any per-row work
+                if not self._HISTORY_RE.search(rows[0].text()):
+                    continue
+
+                # Stop at the 15-entry quota, but scan as many rows as it
+                # takes - rejected rows don't count against it
+                for row in rows[1:]:  # Skip header
+                    if len(history) >= 15:
+                        break
+                    cells = [cell for cell in row.iter()
+                             if cell.tag in ('td', 'th')]
+                    if len(cells) < 2:
+                        continue
+
+                    # Reject on the cheap date cell before stringifying
+                    # the (potentially huge) proceedings cell
+                    date = cells[0].text(strip=True)
+                    if not date or date == '-':
+                        continue
+                    # Limit length while reading - long order texts never
+                    # get stringified past the cap
+                    proceedings = self._capped_text(cells[1], 500)
+                    if not proceedings or proceedings == '-':
+                        continue
+
+                    history.append(Hearing(
+                        date=date,
+                        proceedings=proceedings
+                    ))
+
+                if len(history) >= 15:
+                    break
+
         except Exception as e:
             logger.error(f"Error extracting case history: {str(e)}")
-        
-        return history[:15]  # Limit to last 15 entries
+
+        return history
     
     def get_case_types(self):
         """Get available case types from the court website with enhanced fallback"""
+        # Dropdown contents are static per session - answer from the TTL
+        # cache without touching a driver when it is fresh
+        if (self._case_types_cache is not None and
+                time.time() - self._case_types_ts < self._case_types_ttl):
+            return self._case_types_cache
+
+        case_types = self._fetch_case_types()
+        self._case_types_cache = case_types
+        self._case_types_ts = time.time()
+        return case_types
+
+    async def _probe_urls(self, urls):
+        """HEAD every URL concurrently; returns the subset that answered
+        with a usable status, preserving input order."""
+        async with httpx.AsyncClient(
+                timeout=5, follow_redirects=True,
+                headers={'User-Agent': self.session.headers['User-Agent']}
+        ) as client:
+            responses = await asyncio.gather(
+                *(client.head(url) for url in urls),
+                return_exceptions=True)
+        return [url for url, response in zip(urls, responses)
+                if not isinstance(response, Exception)
+                and response.status_code < 500]
+
+    def _fetch_case_types(self):
+        """Scrape (or fall back to) the case-type list, uncached"""
         urls_to_try = [self.search_url] + self.alternative_urls
+
+        # Cheap async triage before committing a 3-5s driver navigation
+        # per URL: only candidates that answer a HEAD get a browser
+        try:
+            reachable = asyncio.run(self._probe_urls(urls_to_try))
+            if reachable:
+                urls_to_try = reachable
+        except Exception as e:
+            logger.warning(f"URL probe failed, trying all candidates: {str(e)}")
         
         for url in urls_to_try:
             driver = None
             try:
                 logger.info(f"Attempting to fetch case types from: {url}")
                 
-                driver = self.setup_driver()
+                driver = self.acquire_driver()
                 driver.get(url)
                 
-                # Wait for case type dropdown to load with multiple selectors
-                case_type_selectors = [
-                    (By.NAME, "case_type"),
-                    (By.ID, "case_type"),
-                    (By.CLASS_NAME, "case-type"),
-                    (By.XPATH, "//select[contains(@name,'case')]")
-                ]
-                
-                case_type_element = None
-                for selector in case_type_selectors:
-                    try:
-                        case_type_element = WebDriverWait(driver, 10).until(
-                            EC.presence_of_element_located(selector)
-                        )
-                        break
-                    except:
-                        continue
+                # One wait on a union XPath covers every dropdown variant;
+                # the old per-selector loop could block 10s apiece before
+                # moving on
+                try:
+                    case_type_element = WebDriverWait(driver, 15).until(
+                        EC.presence_of_element_located((
+                            By.XPATH,
+                            "//select[@name='case_type' or @id='case_type'"
+                            " or contains(@class,'case-type')"
+                            " or contains(@name,'case')]"
+                        ))
+                    )
+                except TimeoutException:
+                    case_type_element = None
                 
                 if case_type_element:
-                    case_type_select = Select(case_type_element)
+                    # One script call returns every option text; touching
+                    # option.text via Select is a WebDriver round-trip
+                    # per option
+                    texts = driver.execute_script(
+                        "return Array.from(arguments[0].options)"
+                        ".map(o => o.text);",
+                        case_type_element)
                     options = []
-                    
-                    for option in case_type_select.options:
-                        text = option.text.strip()
+
+                    for text in texts:
+                        text = text.strip()
                         if text and text.lower() not in ["select", "", "choose", "select case type"]:
                             options.append(text)
-                    
+
                     if options:
                         logger.info(f"Retrieved {len(options)} case types from court website")
                         return options
@@ -860,11 +1302,8 @@ class DelhiHighCourtScraper:
                 logger.error(f"Error fetching case types from {url}: {str(e)}")
                 continue
             finally:
-                if driver:
-                    try:
-                        driver.quit()
-                    except:
-                        pass
+                self.release_driver(driver)
+                driver = None
         
         # Enhanced fallback case types for Delhi High Court
         logger.info("Using enhanced fallback case types")
@@ -889,6 +1328,23 @@ class DelhiHighCourtScraper:
             "W.P.(CRL) (Writ Petition Criminal)"
         ]
     
+    async def afetch_case_data(self, case_type, case_number, filing_year):
+        """Async wrapper around fetch_case_data.
+
+        The Selenium workflow is blocking, so it is offloaded to a worker
+        thread; concurrency across cases is then bounded by the driver
+        pool rather than one lookup per caller.
+        """
+        return await asyncio.to_thread(
+            self.fetch_case_data, case_type, case_number, filing_year)
+
+    async def afetch_many(self, cases):
+        """Fetch several (case_type, case_number, filing_year) tuples
+        concurrently; returns results in input order."""
+        return await asyncio.gather(
+            *(self.afetch_case_data(*case) for case in cases),
+            return_exceptions=True)
+
     def test_connection(self):
         """Test connection to court website with multiple URLs"""
         urls_to_test = [
@@ -896,19 +1352,29 @@ class DelhiHighCourtScraper:
             self.search_url,
         ] + self.alternative_urls
         
-        for url in urls_to_test:
-            try:
-                logger.info(f"Testing connection to: {url}")
-                response = self.session.get(url, timeout=15)
-                
-                if response.status_code == 200:
-                    logger.info(f"Successfully connected to {url}")
-                    return True, f"Connected to {url}"
-                else:
-                    logger.warning(f"HTTP {response.status_code} from {url}")
-                    
-            except Exception as e:
-                logger.warning(f"Connection failed to {url}: {str(e)}")
-                continue
-        
-        return False, "All connection attempts failed - court website may be unavailable"
+        # Probe every URL at once - the checks are independent blocking
+        # I/O, so wall time is the fastest responder instead of the sum.
+        # Shut down without waiting so the first 200 isn't held up by
+        # dead hosts still timing out.
+        executor = ThreadPoolExecutor(max_workers=len(urls_to_test))
+        try:
+            futures = {
+                executor.submit(self.session.get, url, timeout=15): url
+                for url in urls_to_test
+            }
+
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    response = future.result()
+                    if response.status_code == 200:
+                        logger.info(f"Successfully connected to {url}")
+                        return True, f"Connected to {url}"
+                    else:
+                        logger.warning(f"HTTP {response.status_code} from {url}")
+                except Exception as e:
+                    logger.warning(f"Connection failed to {url}: {str(e)}")
+
+            return False, "All connection attempts failed - court website may be unavailable"
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)